@@ -1,13 +1,262 @@
+import io
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px  # 인터랙티브 그래프 라이브러리 추가
-import seaborn as sns
-import matplotlib.pyplot as plt
 import numpy as np
 
-# 한글 폰트 설정
-plt.rc('font', family='Malgun Gothic')
-plt.rcParams['axes.unicode_minus'] = False
+try:
+    import duckdb  # 대용량 업로드 집계용 (없으면 pandas groupby 사용)
+except ImportError:
+    duckdb = None
+
+try:
+    import polars as pl  # 엑셀 로딩/형 변환용 (없으면 pandas로 처리)
+except ImportError:
+    pl = None
+
+# --- 순서 정의 (사용자 요청 반영) ---
+rank_order = ['부장', '차장', '과장', '대리', '사원']
+grade_order = ['S', 'A', 'B', 'C', 'D']
+
+# 이 행 수 이상이면 부서별 집계를 DuckDB 멀티스레드 해시 집계로 처리
+DUCKDB_MIN_ROWS = 100_000
+
+
+@st.cache_data(show_spinner=False)
+def load_df(file_bytes: bytes) -> pd.DataFrame:
+    """업로드된 엑셀을 읽고 정제까지 마친 데이터프레임을 반환 (파일 내용 기준 캐시)"""
+    # 1. 소수점 데이터 형식 강제 변환 (float64)
+    # 50.1 ~ 99.9 범위를 정확히 인식하기 위함 (float32는 90.2 → 90.19999694824219로 표시됨)
+    target_cols = ['성과점수', '역량점수', '총점', '근무기간', '전년도총점']
+
+    df_pl = None
+    if pl is not None:
+        try:
+            df_pl = pl.read_excel(io.BytesIO(file_bytes))
+        except ImportError:
+            # polars 엑셀 읽기에 필요한 fastexcel이 없으면 아래 pandas 경로 사용
+            pass
+
+    if df_pl is not None:
+        # Polars: 읽기 + 컬럼명 정리 + 숫자 변환을 한 번에 처리한 뒤 pandas로 넘김
+        df_pl = df_pl.rename({c: c.strip() for c in df_pl.columns})
+        df_pl = df_pl.with_columns([
+            pl.col(c).cast(pl.Float64, strict=False).fill_nan(None).fill_null(0.0)
+            for c in target_cols if c in df_pl.columns
+        ])
+        # 사번이 텍스트로 읽히면 pandas처럼 전부 숫자일 때만 정수로 변환 (두 경로의 dtype 통일)
+        if '사번' in df_pl.columns and df_pl['사번'].dtype == pl.String:
+            emp_no = df_pl['사번'].str.strip_chars().cast(pl.Int64, strict=False)
+            if emp_no.null_count() == df_pl['사번'].null_count():
+                df_pl = df_pl.with_columns(emp_no)
+        df = df_pl.to_pandas()
+    else:
+        try:
+            # calamine 엔진이 openpyxl보다 훨씬 빠름 (없으면 openpyxl 사용)
+            df = pd.read_excel(io.BytesIO(file_bytes), engine="calamine")
+        except (ImportError, ValueError):
+            df = pd.read_excel(io.BytesIO(file_bytes), engine="openpyxl")
+        df.columns = df.columns.str.strip()
+
+        present = [c for c in target_cols if c in df.columns]
+        df[present] = df[present].apply(pd.to_numeric, errors='coerce').astype('float64').fillna(0.0)
+
+    # Pandas 데이터프레임에 정렬 순서 적용 (Categorical 타입 변환)
+    if '직급' in df.columns:
+        df['직급'] = pd.Categorical(df['직급'], categories=rank_order, ordered=True)
+    if '종합등급' in df.columns:
+        df['종합등급'] = pd.Categorical(df['종합등급'], categories=grade_order, ordered=True)
+    # groupby 키/반복 문자열은 category로 변환해 해싱 비용과 메모리 절감
+    for col in ['부서', '성명', '사번']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    # 탭에서 쓰는 파생 컬럼
+    if '전년도총점' in df.columns:
+        # 전년 대비 변화량은 한 번만 계산해서 탭별 컬럼명으로 공유
+        diff = (df['총점'] - df['전년도총점']).to_numpy()
+        df = df.assign(변화량=diff, 점수변화량=diff, 점수차이=diff)
+        # 핵심: size에 사용할 절대값 컬럼을 별도로 생성
+        df['변화량_절대값'] = np.abs(diff)
+        # 전년도 점수가 0이면 성장률 0 (inf 생성 후 치환하지 않고 나눗셈 자체를 건너뜀)
+        prev = df['전년도총점'].to_numpy()
+        rate = np.zeros_like(prev)
+        np.divide(diff, prev, out=rate, where=prev != 0)
+        df['성장률(%)'] = rate * 100
+
+    # 근속 구간 (Binning)
+    bins = [0, 2, 5, 10, 20, 100]
+    labels = ['1-2년(신입)', '3-5년(주니어)', '6-10년(시니어)', '11-20년(베테랑)', '20년 이상']
+    # pd.cut과 동일한 (a, b] 구간을 searchsorted로 계산 (범위 밖은 -1 → NaN)
+    edges = np.array(bins, dtype=np.float64)
+    codes = np.searchsorted(edges, df['근무기간'].to_numpy(), side='left') - 1
+    codes[codes >= len(labels)] = -1
+    df['근속구간'] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+    return df
+
+
+def group_mean(keys: pd.Series, values: pd.DataFrame) -> pd.DataFrame:
+    """category 코드 기준 그룹 평균 (groupby(observed=True).mean()과 같은 결과를 bincount로 계산)"""
+    codes = keys.cat.codes.to_numpy()
+    n = len(keys.cat.categories)
+    valid = codes >= 0  # NaN(-1) 제외
+    codes = codes[valid]
+    counts = np.bincount(codes, minlength=n)
+    observed = counts > 0
+    out = {
+        col: np.bincount(codes, weights=values[col].to_numpy()[valid], minlength=n)[observed]
+        / counts[observed]
+        for col in values.columns
+    }
+    index = pd.CategoricalIndex(keys.cat.categories[observed], categories=keys.cat.categories,
+                                ordered=keys.cat.ordered, name=keys.name)
+    return pd.DataFrame(out, index=index)
+
+
+# 캐시 함수에 넘기는 데이터프레임은 shape + 내용 해시로 식별
+df_hash_funcs = {pd.DataFrame: lambda d: (d.shape, pd.util.hash_pandas_object(d, index=False).sum())}
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def dept_agg(df: pd.DataFrame) -> pd.DataFrame:
+    """부서별 총점 표준편차(std)와 평균 성장폭(growth)을 계산 (대용량이면 DuckDB 사용)"""
+    has_growth = '점수변화량' in df.columns
+    if duckdb is not None and len(df) >= DUCKDB_MIN_ROWS:
+        cols = ['부서', '총점'] + (['점수변화량'] if has_growth else [])
+        growth_sql = ', AVG("점수변화량") AS growth' if has_growth else ''
+        con = duckdb.connect()
+        con.register('scores', df[cols])
+        out = con.execute(f'SELECT "부서", STDDEV_SAMP("총점") AS std{growth_sql} FROM scores '
+                          'WHERE "부서" IS NOT NULL GROUP BY "부서"').df()
+        con.close()
+        return out.set_index('부서')
+
+    aggs = dict(std=('총점', 'std'))
+    if has_growth:
+        aggs['growth'] = ('점수변화량', 'mean')
+    # 관측된 부서만, 정렬은 각 탭에서
+    return df.groupby('부서', observed=True, sort=False).agg(**aggs)
+
+
+# --- 그래프 생성 (데이터가 같으면 rerun 시 캐시된 Figure 재사용) ---
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_rank_fig(rank_avg: pd.DataFrame):
+    # Plotly 막대 그래프로 시각화
+    return px.bar(
+        rank_avg,
+        x='직급',
+        y='총점',
+        color='직급',
+        category_orders={'직급': rank_order},  # x축 순서 고정
+        text_auto='.1f',
+        title="직급별 평균 총점 비교",
+        template='plotly_white'
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_dept_fig(df: pd.DataFrame):
+    return px.box(
+        df, x='부서', y='총점', color='부서',
+        points="all" if len(df) <= 500 else "outliers",  # 인원이 많으면 이상치만 표시
+        hover_data=['성명', '직급', '사번'],
+        template='plotly_white'
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_9box_fig(df: pd.DataFrame, render_mode: str, x_mean: float, y_mean: float):
+    # category_orders를 사용하여 등급 순서 고정
+    fig1 = px.scatter(
+        df, x='역량점수', y='성과점수',
+        color='종합등급', size='총점',
+        hover_name='성명',
+        hover_data=['사번', '부서', '총점', '근무기간'],
+        category_orders={'종합등급': grade_order},  # <--- 이 부분이 순서를 결정합니다
+        color_discrete_map={'S': '#FFD700', 'A': '#1f77b4', 'B': '#2ca02c', 'C': '#ff7f0e', 'D': '#d62728'},
+        # 등급별 색상 고정 (선택사항)
+        labels={'역량점수': '역량 (잠재력)', '성과점수': '성과 (현재)'},
+        template='plotly_white',
+        render_mode=render_mode
+    )
+
+    fig1.add_vline(x=x_mean, line_dash="dash", line_color="red")
+    fig1.add_hline(y=y_mean, line_dash="dash", line_color="red")
+    return fig1
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_change_fig(df: pd.DataFrame, render_mode: str, max_val: float):
+    fig2 = px.scatter(
+        df,
+        x='전년도총점',
+        y='총점',
+        color='변화량',
+        color_continuous_scale='RdBu_r',  # 상승은 파랑, 하락은 빨강 계열
+        hover_name='성명',
+        hover_data={'사번': True, '부서': True, '변화량': ':.1f'},  # 뺄셈 오차 없이 소수점 첫째자리로 표시
+        labels={'전년도총점': '2024년 점수', '총점': '2025년 점수'},
+        render_mode=render_mode
+    )
+
+    # 기준선(y=x) 추가
+    fig2.add_shape(type="line", x0=0, y0=0, x1=max_val, y1=max_val,
+                   line=dict(color="Gray", dash="dash"))
+    return fig2
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_growth_fig(df: pd.DataFrame, render_mode: str, min_val: float, max_val: float):
+    fig6 = px.scatter(
+        df, x='전년도총점', y='총점',
+        color='부서', size='변화량_절대값',
+        hover_name='성명',
+        hover_data={'변화량_절대값': ':.1f'},
+        labels={'전년도총점': '2024년 총점 (전년)', '총점': '2025년 총점 (당해)'},
+        template='plotly_white',
+        render_mode=render_mode
+    )
+
+    # 빨간색 점선(y=x 기준선)
+    fig6.add_shape(
+        type="line",
+        x0=min_val, y0=min_val, x1=max_val, y1=max_val,
+        line=dict(color="Red", width=2, dash="dash"),
+        layer="below"  # 점이 선 위에 오도록 설정
+    )
+    return fig6
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_std_fig(dept_std: pd.DataFrame):
+    return px.bar(dept_std, x='부서', y='총점', title="부서 내 성과 불균형(표준편차)",
+                  labels={'총점': '점수 편차'}, template='plotly_white')
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_density_fig(talent_density: pd.DataFrame):
+    return px.bar(talent_density, x='부서', y='고성과자 비중(%)',
+                  color='고성과자 비중(%)', color_continuous_scale='Greens',
+                  text_auto='.1f', template='plotly_white')
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_tenure_fig(tenure_perf: pd.DataFrame):
+    return px.line(tenure_perf, x='근속구간', y='총점', markers=True,
+                   title="근속 기간에 따른 성과 성장 곡선", template='plotly_white')
+
+
+@st.cache_data(show_spinner=False, hash_funcs=df_hash_funcs)
+def build_balance_fig(rank_balance_melted: pd.DataFrame):
+    return px.bar(rank_balance_melted, x='직급', y='점수', color='평가항목', barmode='group',
+                  category_orders={'직급': rank_order},
+                  color_discrete_map={'역량점수': '#636EFA', '성과점수': '#EF553B'},
+                  template='plotly_white')
+
 
 st.set_page_config(page_title="인사평가 소수점 정밀 분석", layout="wide")
 st.title("📈 2025 인사평가 정밀 데이터 분석 시스템")
@@ -15,200 +264,129 @@ st.title("📈 2025 인사평가 정밀 데이터 분석 시스템")
 uploaded_file = st.file_uploader("소수점 점수가 포함된 엑셀 파일을 업로드하세요", type=["xlsx"])
 
 if uploaded_file:
-    df = pd.read_excel(uploaded_file)
-    df.columns = df.columns.str.strip()
+    df = load_df(uploaded_file.getvalue())
 
-    # 1. 소수점 데이터 형식 강제 변환 (float64)
-    # 50.1 ~ 99.9 범위를 정확히 인식하기 위함
-    target_cols = ['성과점수', '역량점수', '총점', '근무기간', '전년도총점']
-    for col in target_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce').astype(float).fillna(0.0)
+    # 여러 탭에서 반복 사용하는 컬럼 통계는 한 번만 계산
+    mean_cols = [c for c in ['역량점수', '성과점수', '총점', '전년도총점', '근무기간'] if c in df.columns]
+    means = df[mean_cols].mean()
+    # 전년/올해 점수 공통 범위 → tab3, tab6의 y=x 기준선에 공유
+    range_cols = [c for c in ['총점', '전년도총점'] if c in df.columns]
+    both = np.concatenate([df[c].to_numpy() for c in range_cols])
+    lim_min, lim_max = (float(both.min()), float(both.max())) if both.size else (np.nan, np.nan)
+
+    # 점이 많으면 SVG 대신 WebGL로 산점도 렌더링
+    RENDER = 'webgl' if len(df) >= 1000 else 'svg'
 
     # 상단 대시보드 (소수점 첫째자리까지 표시)
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("총 인원", f"{len(df)}명")
-    c2.metric("평균 총점", f"{df['총점'].mean():.2f}점")
+    c2.metric("평균 총점", f"{means['총점']:.2f}점")
     if '전년도총점' in df.columns:
-        growth_avg = (df['총점'] - df['전년도총점']).mean()
+        growth_avg = df['점수변화량'].mean()
         c3.metric("평균 성장폭", f"{growth_avg:+.2f}점")
-    c4.metric("평균 근속", f"{df['근무기간'].mean():.1f}년")
+    c4.metric("평균 근속", f"{means['근무기간']:.1f}년")
 
     st.divider()
 
-    # --- 순서 정의 (사용자 요청 반영) ---
-    rank_order = ['부장', '차장', '과장', '대리', '사원']
-    grade_order = ['S', 'A', 'B', 'C', 'D']
-
-    # Pandas 데이터프레임에 정렬 순서 적용 (Categorical 타입 변환)
-    if '직급' in df.columns:
-        df['직급'] = pd.Categorical(df['직급'], categories=rank_order, ordered=True)
-    if '종합등급' in df.columns:
-        df['종합등급'] = pd.Categorical(df['종합등급'], categories=grade_order, ordered=True)
-
     # 탭 구성
-    # 탭 구성에 tab8 추가
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+    # st.tabs는 모든 탭 코드를 매번 실행하므로, radio로 선택된 화면만 그리도록 구성
+    view = st.radio("View", [
         "[부서/직급]", "[9-Box Matrix]", "[근속 성과]", "[등급 분포]",
         "[핵심인재]", "[성과 성장 분석]", "[리스크 & 코칭]", "[조직 성장 엔진]"
-    ])
+    ], horizontal=True, key='view', label_visibility='collapsed')
 
-    with tab1:
+    if view == "[부서/직급]":
         st.subheader("직급별 평균 성과 (부장 → 사원 순)")
 
         # 직급별 평균 계산 (정렬된 직급 순서 유지)
         if '직급' in df.columns:
-            rank_avg = df.groupby('직급', observed=True)['총점'].mean().reset_index()
-
-            # Plotly 막대 그래프로 시각화
-            fig_rank = px.bar(
-                rank_avg,
-                x='직급',
-                y='총점',
-                color='직급',
-                category_orders={'직급': rank_order},  # x축 순서 고정
-                text_auto='.1f',
-                title="직급별 평균 총점 비교",
-                template='plotly_white'
-            )
+            rank_avg = group_mean(df['직급'], df[['총점']]).reset_index()
+
+            fig_rank = build_rank_fig(rank_avg)
             st.plotly_chart(fig_rank, width='stretch')
 
             # 부서별 점수 분포 (Box Plot)
             st.subheader("부서별 성과 점수 분포")
-            fig_dept = px.box(
-                df, x='부서', y='총점', color='부서',
-                points="all",  # 모든 데이터 점 표시
-                hover_data=['성명', '직급', '사번'],
-                template='plotly_white'
-            )
+            fig_dept = build_dept_fig(df[['부서', '총점', '성명', '직급', '사번']])
             st.plotly_chart(fig_dept, width='stretch')
 
-    with tab2:
+    elif view == "[9-Box Matrix]":
         st.subheader("성과-역량 9-Box Matrix")
         st.caption("점이 클수록 총점이 높습니다. 마우스를 올리면 상세 정보가 표시됩니다.")
 
-        # category_orders를 사용하여 등급 순서 고정
-        fig1 = px.scatter(
-            df, x='역량점수', y='성과점수',
-            color='종합등급', size='총점',
-            hover_name='성명',
-            hover_data=['사번', '부서', '총점', '근무기간'],
-            category_orders={'종합등급': grade_order},  # <--- 이 부분이 순서를 결정합니다
-            color_discrete_map={'S': '#FFD700', 'A': '#1f77b4', 'B': '#2ca02c', 'C': '#ff7f0e', 'D': '#d62728'},
-            # 등급별 색상 고정 (선택사항)
-            labels={'역량점수': '역량 (잠재력)', '성과점수': '성과 (현재)'},
-            template='plotly_white'
-        )
-
-        fig1.add_vline(x=df['역량점수'].mean(), line_dash="dash", line_color="red")
-        fig1.add_hline(y=df['성과점수'].mean(), line_dash="dash", line_color="red")
-
+        # 그래프에 필요한 컬럼만 넘겨서 직렬화/해싱 데이터 최소화
+        plot_df = df[['역량점수', '성과점수', '종합등급', '총점', '성명', '사번', '부서', '근무기간']]
+        fig1 = build_9box_fig(plot_df, RENDER, means['역량점수'], means['성과점수'])
         st.plotly_chart(fig1, width='stretch')
 
-    with tab3:
+    elif view == "[근속 성과]":
         st.subheader("전년 대비 성과 변화 추적")
         if '전년도총점' in df.columns:
-            # 변화량 계산
-            df['변화량'] = df['총점'] - df['전년도총점']
-
-            fig2 = px.scatter(
-                df,
-                x='전년도총점',
-                y='총점',
-                color='변화량',
-                color_continuous_scale='RdBu_r',  # 상승은 파랑, 하락은 빨강 계열
-                hover_name='성명',
-                hover_data=['사번', '부서', '변화량'],
-                labels={'전년도총점': '2024년 점수', '총점': '2025년 점수'}
-            )
-
-            # 기준선(y=x) 추가
-            max_val = max(df['총점'].max(), df['전년도총점'].max())
-            fig2.add_shape(type="line", x0=0, y0=0, x1=max_val, y1=max_val,
-                           line=dict(color="Gray", dash="dash"))
-
+            fig2 = build_change_fig(df[['전년도총점', '총점', '변화량', '성명', '사번', '부서']], RENDER, lim_max)
             st.plotly_chart(fig2, width='stretch')
             st.info("점선보다 위에 있는 점이 전년 대비 성적이 오른 직원입니다.")
 
-    with tab4:
-        with tab4:
-            st.subheader("종합등급 분포")
-            if '종합등급' in df.columns:
-                grade_counts = df['종합등급'].value_counts().sort_index()
-                st.bar_chart(grade_counts)
-            st.dataframe(df)
+    elif view == "[등급 분포]":
+        st.subheader("종합등급 분포")
+        if '종합등급' in df.columns:
+            grade_counts = df['종합등급'].value_counts().sort_index()
+            st.bar_chart(grade_counts)
+        st.dataframe(df)
 
-    with tab5:
+    elif view == "[핵심인재]":
         st.subheader("핵심인재 프로파일링")
-        star_threshold = df['총점'].quantile(0.9)
-        stars = df[df['총점'] >= star_threshold]
+        # 전체 정렬 없이 O(n) 선택으로 상위 10%를 고른 뒤 그 k개만 정렬
+        vals = df['총점'].to_numpy()
+        if len(vals):
+            k = max(1, len(vals) // 10)
+            top_idx = np.argpartition(vals, -k)[-k:]
+            top_idx = top_idx[np.argsort(vals[top_idx])[::-1]]
+            star_threshold = vals[top_idx[-1]]
+            stars = df.iloc[top_idx]
+        else:
+            # 데이터 행이 없으면 기준점 NaN, 빈 표 표시
+            star_threshold, stars = np.nan, df
         st.write(f"**상위 10% 기준점:** {star_threshold:.2f}점")
-        st.dataframe(stars.sort_values(by='총점', ascending=False))
+        st.dataframe(stars)
 
-    with tab6:
+    elif view == "[성과 성장 분석]":
         st.subheader("전년 대비 성과 성장자(Top Improvers) 추적")
 
         # 1. 전년도 데이터가 있는지 확인
         if '전년도총점' in df.columns:
-            # 변화량 및 변화율 계산
-            df['점수변화량'] = df['총점'] - df['전년도총점']
-            # 핵심: size에 사용할 절대값 컬럼을 별도로 생성
-            df['변화량_절대값'] = df['점수변화량'].abs()
-            df['성장률(%)'] = (df['점수변화량'] / df['전년도총점'] * 100).replace([np.inf, -np.inf], 0)
-
             col_up, col_down = st.columns(2)
 
             with col_up:
                 st.write("**최고 성장자 TOP 5 (상승폭 기준)**")
-                top_improvers = df.sort_values(by='점수변화량', ascending=False).head(5)
+                top_improvers = df.nlargest(5, '점수변화량')
                 st.table(top_improvers[['성명', '부서', '전년도총점', '총점', '점수변화량']])
 
             with col_down:
                 st.write("**부서별 평균 성장폭**")
-                dept_growth = df.groupby('부서')['점수변화량'].mean().sort_values()
+                dept_growth = dept_agg(df)['growth'].rename('점수변화량').sort_values()
                 st.bar_chart(dept_growth)
 
             # 시각화: 전년 vs 올해 점수 산점도
             st.write("**전년도 점수 vs 올해 점수 비교**")
 
-            fig6 = px.scatter(
-                df, x='전년도총점', y='총점',
-                color='부서', size='변화량_절대값',
-                hover_name='성명',
-                labels={'전년도총점': '2024년 총점 (전년)', '총점': '2025년 총점 (당해)'},
-                template='plotly_white'
-            )
-
-            # --- 빨간색 점선(y=x 기준선) 추가 시작 ---
-            # 차트의 범위를 결정하기 위해 최대/최소값 계산
-            max_val = max(df['총점'].max(), df['전년도총점'].max())
-            min_val = min(df['총점'].min(), df['전년도총점'].min())
-
-            fig6.add_shape(
-                type="line",
-                x0=min_val, y0=min_val, x1=max_val, y1=max_val,
-                line=dict(color="Red", width=2, dash="dash"),
-                layer="below"  # 점이 선 위에 오도록 설정
-            )
-            # --- 빨간색 점선 추가 끝 ---
-
+            # 차트의 범위(y=x 기준선)는 전체 최대/최소값으로 결정
+            fig6 = build_growth_fig(df[['전년도총점', '총점', '부서', '변화량_절대값', '성명']], RENDER, lim_min, lim_max)
             st.plotly_chart(fig6, width='stretch')
 
             st.info("빨간 점선 위에 위치한 인원이 전년 대비 성적이 향상된 직원들입니다.")
         else:
             st.warning("데이터에 '전년도총점' 컬럼이 없습니다. 분석을 위해 전년도 데이터를 포함해 주세요.")
 
-    with tab7:
+    elif view == "[리스크 & 코칭]":
         st.subheader("성과 리스크 및 코칭 대상자 분석")
         st.caption("역량과 성과의 불균형이 있거나 성적이 급락한 인원을 집중 관리합니다.")
 
         # 1. 잠재력 미발휘군 (High Potential, Low Performance)
         # 역량은 평균 이상인데 성과는 평균 이하인 인원
-        potential_risk = df[(df['역량점수'] > df['역량점수'].mean()) & (df['성과점수'] < df['성과점수'].mean())]
+        potential_risk = df[(df['역량점수'] > means['역량점수']) & (df['성과점수'] < means['성과점수'])]
 
         # 2. 성적 급락자 (Shock Drop) - 전년도 데이터가 있을 경우
         if '전년도총점' in df.columns:
-            df['점수차이'] = df['총점'] - df['전년도총점']
             warning_drop = df[df['점수차이'] <= -10].sort_values(by='점수차이')  # 10점 이상 하락
 
         col_risk1, col_risk2 = st.columns(2)
@@ -231,56 +409,44 @@ if uploaded_file:
         # 3. 부서별 성과 격차 (Deviation)
         st.subheader("부서별 성과 편차 분석")
         # 편차가 크다는 것은 부서 내 실력 차이가 극심함을 의미
-        dept_std = df.groupby('부서')['총점'].std().sort_values(ascending=False).reset_index()
-        fig_std = px.bar(dept_std, x='부서', y='총점', title="부서 내 성과 불균형(표준편차)",
-                         labels={'총점': '점수 편차'}, template='plotly_white')
+        dept_std = dept_agg(df)['std'].rename('총점').sort_values(ascending=False).reset_index()
+        fig_std = build_std_fig(dept_std)
         st.plotly_chart(fig_std, width='stretch')
 
-    with tab8:
+    elif view == "[조직 성장 엔진]":
         st.subheader("조직 인재 밀도 및 성장 엔진 분석")
         st.caption("부서별 고성과자 비중과 근속 구간별 성과 기여도를 분석합니다.")
 
         # 1. 부서별 인재 밀도 (S/A 등급 비중)
-        # 전체 인원 중 S 또는 A 등급의 비율 계산
-        dept_total = df.groupby('부서').size()
-        dept_stars = df[df['종합등급'].isin(['S', 'A'])].groupby('부서').size()
-        talent_density = (dept_stars / dept_total * 100).fillna(0).sort_values(ascending=False).reset_index()
-        talent_density.columns = ['부서', '고성과자 비중(%)']
+        # 전체 인원 중 S 또는 A 등급의 비율 계산 (부서 코드 bincount로 해싱 없이 집계)
+        is_star = df['종합등급'].isin(['S', 'A']).to_numpy()
+        talent_density = group_mean(df['부서'], pd.DataFrame({'고성과자 비중(%)': is_star * 100.0})) \
+            .sort_values('고성과자 비중(%)', ascending=False).reset_index()
 
         col_engine1, col_engine2 = st.columns(2)
 
         with col_engine1:
             st.write("**부서별 인재 밀도 (S/A등급 비율)**")
-            fig_density = px.bar(talent_density, x='부서', y='고성과자 비중(%)',
-                                 color='고성과자 비중(%)', color_continuous_scale='Greens',
-                                 text_auto='.1f', template='plotly_white')
+            fig_density = build_density_fig(talent_density)
             st.plotly_chart(fig_density, width='stretch')
 
         with col_engine2:
             # 2. 근속 구간별 성과 분포 (Binning)
-            bins = [0, 2, 5, 10, 20, 100]
-            labels = ['1-2년(신입)', '3-5년(주니어)', '6-10년(시니어)', '11-20년(베테랑)', '20년 이상']
-            df['근속구간'] = pd.cut(df['근무기간'], bins=bins, labels=labels)
-
-            tenure_perf = df.groupby('근속구간', observed=True)['총점'].mean().reset_index()
+            tenure_perf = group_mean(df['근속구간'], df[['총점']]).reset_index()
 
             st.write("**⏳ 근속 구간별 평균 성과**")
-            fig_tenure = px.line(tenure_perf, x='근속구간', y='총점', markers=True,
-                                 title="근속 기간에 따른 성과 성장 곡선", template='plotly_white')
+            fig_tenure = build_tenure_fig(tenure_perf)
             st.plotly_chart(fig_tenure, width='stretch')
 
         st.divider()
 
         # 3. 직급별 역량 vs 성과 밸런스 (Radar Chart 대용 Bar)
         st.subheader("직급별 역량-성과 밸런스")
-        rank_balance = df.groupby('직급', observed=True)[['역량점수', '성과점수']].mean().reset_index()
+        rank_balance = group_mean(df['직급'], df[['역량점수', '성과점수']]).reset_index()
 
         # 데이터를 긴 형식(Long format)으로 변환
         rank_balance_melted = rank_balance.melt(id_vars='직급', var_name='평가항목', value_name='점수')
 
-        fig_balance = px.bar(rank_balance_melted, x='직급', y='점수', color='평가항목', barmode='group',
-                             category_orders={'직급': rank_order},
-                             color_discrete_map={'역량점수': '#636EFA', '성과점수': '#EF553B'},
-                             template='plotly_white')
+        fig_balance = build_balance_fig(rank_balance_melted)
         st.plotly_chart(fig_balance, width='stretch')
         st.info("직급이 높아질수록 역량과 성과 점수가 균형 있게 동반 상승하는 것이 이상적입니다.")